@@ -3,44 +3,167 @@
 Build all placeholder packages.
 """
 
+import os
 import subprocess
 import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 PACKAGES = ["toy_package_a", "toy_package_b"]
 
+# Number of trailing build output lines repeated in a failure report
+ERROR_TAIL_LINES = 200
+
+# Serializes log flushes so output from concurrent builds is not interleaved
+_print_lock = threading.Lock()
+
+# Serializes installs into the shared build environment
+_install_lock = threading.Lock()
+
+
+def _flush_log(lines):
+    """Print buffered log lines as one uninterrupted block."""
+    with _print_lock:
+        for line in lines:
+            print(line)
+
+
+def build_package(package_name, env):
+    """Build a single package inside the isolated build environment ``env``."""
+    log = []
+    try:
+        return _build_package(package_name, env, log)
+    finally:
+        _flush_log(log)
+
+
+def _build_package(package_name, env, log):
+    """Build a single package, appending progress messages to ``log``."""
+    from build import BuildBackendException, BuildException, ProjectBuilder
 
-def build_package(package_name):
-    """Build a single package."""
     package_dir = Path(package_name)
 
     if not package_dir.exists():
-        print(f"[ERROR] Package directory {package_name} does not exist!")
+        log.append(f"[ERROR] Package directory {package_name} does not exist!")
         return False
 
-    print(f"\n[BUILD] Building {package_name}...")
+    _flush_log([f"\n[BUILD] Building {package_name}..."])
+
+    tail = deque(maxlen=ERROR_TAIL_LINES)
+    outdir = package_dir / "dist"
 
     try:
-        result = subprocess.run(
-            [sys.executable, "-m", "build"],
-            cwd=package_dir,
-            capture_output=True,
-            text=True,
+        # Drive the build backend from this interpreter instead of spawning
+        # a fresh ``python -m build`` process per package
+        builder = ProjectBuilder.from_isolated_env(
+            env, package_dir, runner=_streaming_runner(package_name, tail)
         )
+        distributions = ("sdist", "wheel")
+
+        # Resolve what both targets need up front so the environment is
+        # topped up with a single install, then build each from the source
+        requires = set()
+        for distribution in distributions:
+            requires |= builder.get_requires_for_build(distribution)
+        with _install_lock:
+            env.install(requires)
 
-        if result.returncode == 0:
-            print(f"[OK] Successfully built {package_name}")
-            return True
-        else:
-            print(f"[ERROR] Failed to build {package_name}")
-            print(result.stderr)
-            return False
+        for distribution in distributions:
+            builder.build(distribution, outdir)
+
+        log.append(f"[OK] Successfully built {package_name}")
+        return True
+
+    except (BuildException, BuildBackendException) as e:
+        log.append(f"[ERROR] Failed to build {package_name}: {e}")
+        log.extend(tail)
+        return False
 
     except Exception as e:
-        print(f"[ERROR] Exception while building {package_name}: {e}")
+        log.append(f"[ERROR] Exception while building {package_name}: {e}")
         return False
 
 
+def _streaming_runner(package_name, tail):
+    """
+    Create a build hook runner that echoes hook output live.
+
+    Each line is prefixed with the package name and the most recent lines
+    are kept in ``tail`` for the failure report.
+    """
+
+    def runner(cmd, cwd=None, extra_environ=None):
+        env = os.environ.copy()
+        if extra_environ:
+            env.update(extra_environ)
+
+        # Descriptors are non-inheritable by default (PEP 446), so there is
+        # nothing to close in the child; skipping the sweep keeps spawns cheap
+        with subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            close_fds=False,
+        ) as proc:
+            for line in proc.stdout:
+                line = line.rstrip("\n")
+                tail.append(line)
+                _flush_log([f"  [{package_name}] {line}"])
+
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+    return runner
+
+
+def _preflight(packages):
+    """
+    Check that every package has a parseable ``pyproject.toml``.
+
+    Runs before any build starts so a broken package fails the run
+    immediately rather than after the others have been built. Exits on
+    failure; otherwise returns the parsed ``pyproject.toml`` of each package.
+    """
+    try:
+        import tomllib
+    except ImportError:  # Python < 3.11
+        import tomli as tomllib
+
+    pyprojects = {}
+    problems = []
+    for package in packages:
+        pyproject = Path(package) / "pyproject.toml"
+        if not pyproject.is_file():
+            problems.append(f"{package}: {pyproject} not found")
+            continue
+        try:
+            pyprojects[package] = tomllib.loads(pyproject.read_text(encoding="utf-8"))
+        except (tomllib.TOMLDecodeError, UnicodeDecodeError) as e:
+            problems.append(f"{package}: invalid {pyproject}: {e}")
+
+    if problems:
+        print("\n[ERROR] Preflight check failed:")
+        for problem in problems:
+            print(f"  - {problem}")
+        sys.exit(1)
+
+    return pyprojects
+
+
+def _build_system_requires(pyprojects):
+    """Collect the union of ``[build-system] requires`` across parsed pyprojects."""
+    requires = set()
+    for pyproject in pyprojects.values():
+        requires.update(pyproject.get("build-system", {}).get("requires", []))
+    return requires
+
+
 def main():
     """Build all packages."""
     print("=" * 60)
@@ -49,20 +172,32 @@ def main():
 
     # Check if build module is available
     try:
-        import build
+        from build.env import DefaultIsolatedEnv
     except ImportError:
         print("\n[ERROR] 'build' module not found. Please install it:")
         print("  pip install build")
         sys.exit(1)
 
-    success_count = 0
-    failed_packages = []
-
-    for package in PACKAGES:
-        if build_package(package):
-            success_count += 1
-        else:
-            failed_packages.append(package)
+    pyprojects = _preflight(PACKAGES)
+
+    # All packages share one isolated environment, so the build backend is
+    # installed once instead of once per package
+    with DefaultIsolatedEnv() as env:
+        try:
+            env.install(_build_system_requires(pyprojects))
+        except Exception as e:
+            print(f"\n[ERROR] Failed to set up the build environment: {e}")
+            sys.exit(1)
+
+        # Builds are independent and spend their time waiting on child
+        # processes, so threads are enough to run them concurrently
+        with ThreadPoolExecutor(max_workers=len(PACKAGES)) as executor:
+            results = list(
+                executor.map(lambda package: build_package(package, env), PACKAGES)
+            )
+
+    success_count = sum(results)
+    failed_packages = [pkg for pkg, ok in zip(PACKAGES, results) if not ok]
 
     print("\n" + "=" * 60)
     print(f"Build Summary: {success_count}/{len(PACKAGES)} successful")
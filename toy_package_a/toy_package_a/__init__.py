@@ -1,3 +1,6 @@
 from .hello_a import hello_a  # noqa: F401
 
-__version__: str = "0.0.0"
+try:
+    from ._version import __version__  # noqa: F401
+except ImportError:  # source checkout that has never been built
+    __version__ = "0.0.0+unknown"
@@ -0,0 +1,29 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import toy_package_b
+
+PACKAGE_ROOT = Path(toy_package_b.__file__).resolve().parents[1]
+VERSION_SCRIPT = "import toy_package_b; print(toy_package_b.__version__)"
+
+
+@pytest.fixture(scope="module")
+def version_cli():
+    # Interpreter startup dominates these checks, so spawn it once per module
+    return subprocess.run(
+        [sys.executable, "-c", VERSION_SCRIPT],
+        cwd=PACKAGE_ROOT,
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_version_cli_succeeds(version_cli):
+    assert version_cli.returncode == 0, version_cli.stderr
+
+
+def test_version_cli_matches_module(version_cli):
+    assert version_cli.stdout.strip() == toy_package_b.__version__